@@ -1,17 +1,22 @@
 """The BLOOMIN8 E-Ink Canvas integration."""
 from __future__ import annotations
 
+import asyncio
+from collections import deque
+from contextlib import AsyncExitStack
 from dataclasses import dataclass, field
+from functools import partial
 import logging
+import time
 import voluptuous as vol
-from datetime import datetime
-import random
 from typing import Any
 
-from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import Platform, CONF_HOST, CONF_NAME
+from homeassistant.components.media_player import DOMAIN as MEDIA_DOMAIN
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.const import ATTR_ENTITY_ID, Platform, CONF_HOST, CONF_NAME
 from homeassistant.core import HomeAssistant, ServiceCall
 from homeassistant.helpers import device_registry as dr
+from homeassistant.helpers import entity_registry as er
 import homeassistant.helpers.config_validation as cv
 
 from .api_client import EinkCanvasApiClient
@@ -21,14 +26,108 @@ _LOGGER = logging.getLogger(__name__)
 
 CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 
+# Services registered by the integration
+_SERVICE_NAMES: tuple[str, ...] = (
+    "show_next",
+    "sleep",
+    "reboot",
+    "clear_screen",
+    "whistle",
+    "refresh_device_info",
+    "update_settings",
+    "sync_photos",
+    "push_random_item",
+)
+
+# Services calling the API client method of the same name: (service, success log, failure log)
+_SIMPLE_SERVICES: tuple[tuple[str, str, str], ...] = (
+    ("show_next", "Successfully switched to next image", "Failed to switch to next image"),
+    ("sleep", "Device entered sleep mode", "Device sleep failed"),
+    ("reboot", "Device reboot command sent", "Device reboot failed"),
+    ("clear_screen", "Screen cleared", "Clear screen failed"),
+    ("whistle", "Keep alive signal sent", "Keep alive failed"),
+)
+
+# Service schemas (entity_id selects the target device, all devices if omitted)
+_TARGET_SCHEMA = vol.Schema({
+    vol.Optional(ATTR_ENTITY_ID): cv.entity_ids,
+})
+_UPDATE_SETTINGS_KEYS = ("name", "sleep_duration", "max_idle", "idx_wake_sens")
+_UPDATE_SETTINGS_SCHEMA = _TARGET_SCHEMA.extend({
+    vol.Optional("name"): str,
+    vol.Optional("sleep_duration"): int,
+    vol.Optional("max_idle"): int,
+    vol.Optional("idx_wake_sens"): int,
+})
+_SYNC_PHOTOS_SCHEMA = _TARGET_SCHEMA.extend({
+    vol.Required("media_source_id"): str,
+    vol.Optional("target_gallery", default="default"): str,
+    vol.Optional("max_photos", default=50): int,
+    vol.Optional("overwrite_existing", default=False): bool,
+})
+_PUSH_RANDOM_ITEM_SCHEMA = _TARGET_SCHEMA.extend({
+    vol.Required("media_source_id"): str,
+})
+
+
+# Info records kept in a device log buffer per window, bursts up to this size pass
+_LOG_BURST = 10
+_LOG_WINDOW = 1.0
+
+
+class _RingHandler(logging.Handler):
+    """Log handler keeping the latest messages of a device in a bounded deque.
+
+    Entries are (created, levelname, message) tuples, so the buffer does not keep
+    the record arguments (and any tracebacks they reference) alive.
+    """
+
+    def __init__(self, buffer: deque[tuple[float, str, str]]) -> None:
+        """Initialize the handler."""
+        super().__init__()
+        self.buffer = buffer
+        # Token bucket refilled at _LOG_BURST tokens per _LOG_WINDOW seconds
+        self._tokens = float(_LOG_BURST)
+        self._last_refill = time.monotonic()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        """Drop floods of info records, warnings and errors are always kept."""
+        if record.levelno < logging.WARNING:
+            # Monotonic time, wall clock corrections must not drain the bucket
+            now = time.monotonic()
+            elapsed = now - self._last_refill
+            self._last_refill = now
+            self._tokens = min(_LOG_BURST, self._tokens + elapsed * _LOG_BURST / _LOG_WINDOW)
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+        return super().filter(record)
+
+    def handle(self, record: logging.LogRecord) -> bool:
+        """Pass the record on to the integration logger, then buffer it."""
+        # The device logger does not propagate, so the buffer gets info records
+        # regardless of the Home Assistant log level
+        if _LOGGER.isEnabledFor(record.levelno):
+            _LOGGER.handle(record)
+        return super().handle(record)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        """Store the message, the deque drops the oldest one once full."""
+        try:
+            self.buffer.append((record.created, record.levelname, record.getMessage()))
+        except Exception:
+            self.handleError(record)
+
 
 @dataclass
 class RuntimeData:
     """Runtime data for BLOOMIN8 E-Ink Canvas integration."""
 
     api_client: EinkCanvasApiClient
+    logger: logging.Logger
     device_info: dict[str, Any] | None = None
-    logs: list[dict[str, Any]] = field(default_factory=list)
+    logs: deque[tuple[float, str, str]] = field(default_factory=lambda: deque(maxlen=50))
+    media_player_entity_ids: set[str] = field(default_factory=set)
 
 
 # Extend ConfigEntry to type hint runtime_data
@@ -55,11 +154,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: EinkCanvasConfigEntry) -
     host = entry.data[CONF_HOST]
     name = entry.data.get(CONF_NAME, DEFAULT_NAME)
 
-    # Create API client
-    api_client = EinkCanvasApiClient(hass, host)
+    # Create API client, the exit stack closes it when the entry is unloaded
+    exit_stack = AsyncExitStack()
+    entry.async_on_unload(exit_stack.aclose)
+    api_client = await exit_stack.enter_async_context(EinkCanvasApiClient(hass, host))
 
-    # Store runtime data
-    entry.runtime_data = RuntimeData(api_client=api_client)
+    # Store runtime data, device logs are kept by a handler on a per-entry logger
+    logger = _LOGGER.getChild(entry.entry_id)
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    entry.runtime_data = RuntimeData(api_client=api_client, logger=logger)
+    log_handler = _RingHandler(entry.runtime_data.logs)
+    logger.addHandler(log_handler)
+    entry.async_on_unload(lambda: logger.removeHandler(log_handler))
 
     # Create device registration
     device_registry = dr.async_get(hass)
@@ -71,8 +178,9 @@ async def async_setup_entry(hass: HomeAssistant, entry: EinkCanvasConfigEntry) -
         model="E-Ink Canvas",
     )
 
-    # Register services
-    await _register_services(hass, entry)
+    # Register services once, they are shared by all configured devices
+    if not hass.services.has_service(DOMAIN, "show_next"):
+        await _register_services(hass)
 
     # Set up platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
@@ -80,106 +188,81 @@ async def async_setup_entry(hass: HomeAssistant, entry: EinkCanvasConfigEntry) -
     return True
 
 
-async def _register_services(hass: HomeAssistant, entry: EinkCanvasConfigEntry) -> None:
-    """Register device control services."""
-    runtime_data = entry.runtime_data
-    api_client = runtime_data.api_client
-
-    def add_log(message: str, level: str = "info") -> None:
-        """Add log entry (synchronous)."""
-        log_entry = {
-            "timestamp": datetime.now(),
-            "level": level,
-            "message": message,
-        }
-
-        runtime_data.logs.append(log_entry)
-        # Keep only the latest 50 logs
-        if len(runtime_data.logs) > 50:
-            runtime_data.logs.pop(0)
-        
-        # Also log to Home Assistant core log
-        if level == "error":
-            _LOGGER.error(message)
-        elif level == "warning":
-            _LOGGER.warning(message)
-        else:
-            _LOGGER.info(message)
-
-    async def handle_show_next(call: ServiceCall) -> None:
-        """Handle show next image service."""
-        success = await api_client.show_next()
-        if success:
-            add_log("Successfully switched to next image")
-        else:
-            add_log("Failed to switch to next image", "error")
+class _EinkServices:
+    """Device control service handlers shared by all configured devices."""
 
-    async def handle_sleep(call: ServiceCall) -> None:
-        """Handle device sleep service."""
-        success = await api_client.sleep()
-        if success:
-            add_log("Device entered sleep mode")
-        else:
-            add_log("Device sleep failed", "error")
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the service handlers."""
+        self.hass = hass
 
-    async def handle_reboot(call: ServiceCall) -> None:
-        """Handle device reboot service."""
-        success = await api_client.reboot()
-        if success:
-            add_log("Device reboot command sent")
-        else:
-            add_log("Device reboot failed", "error")
+    def _target_entries(self, call: ServiceCall) -> list[EinkCanvasConfigEntry]:
+        """Return the loaded config entries targeted by a service call.
 
-    async def handle_clear_screen(call: ServiceCall) -> None:
-        """Handle clear screen service."""
-        success = await api_client.clear_screen()
-        if success:
-            add_log("Screen cleared")
-        else:
-            add_log("Clear screen failed", "error")
+        Entities listed in entity_id select the devices they belong to; without
+        entity_id the call applies to every loaded device.
+        """
+        entries = [
+            entry for entry in self.hass.config_entries.async_entries(DOMAIN)
+            if entry.state is ConfigEntryState.LOADED
+        ]
+        entity_ids = call.data.get(ATTR_ENTITY_ID)
+        if not entity_ids:
+            return entries
+
+        entity_registry = er.async_get(self.hass)
+        entry_ids = {
+            entity_entry.config_entry_id
+            for entity_id in entity_ids
+            if (entity_entry := entity_registry.async_get(entity_id))
+        }
+        return [entry for entry in entries if entry.entry_id in entry_ids]
 
-    async def handle_whistle(call: ServiceCall) -> None:
-        """Handle keep alive service."""
-        success = await api_client.whistle()
+    async def for_each_device(self, handler, call: ServiceCall) -> None:
+        """Run a per-device handler for every targeted device."""
+        entries = self._target_entries(call)
+        if not entries:
+            _LOGGER.error("No loaded BLOOMIN8 E-Ink Canvas device matches %s", call.data.get(ATTR_ENTITY_ID))
+            return
+        for entry in entries:
+            await handler(entry.runtime_data, call)
+
+    async def simple_command(
+        self, method: str, success_msg: str, failure_msg: str, runtime_data: RuntimeData, call: ServiceCall
+    ) -> None:
+        """Handle a service that runs a device command without parameters."""
+        success = await getattr(runtime_data.api_client, method)()
         if success:
-            add_log("Keep alive signal sent")
+            runtime_data.logger.info(success_msg)
         else:
-            add_log("Keep alive failed", "error")
+            runtime_data.logger.error(failure_msg)
 
-    async def handle_update_settings(call: ServiceCall) -> None:
+    async def update_settings(self, runtime_data: RuntimeData, call: ServiceCall) -> None:
         """Handle update device settings service."""
-        settings_data = {}
-
-        if "name" in call.data:
-            settings_data["name"] = call.data["name"]
-        if "sleep_duration" in call.data:
-            settings_data["sleep_duration"] = call.data["sleep_duration"]
-        if "max_idle" in call.data:
-            settings_data["max_idle"] = call.data["max_idle"]
-        if "idx_wake_sens" in call.data:
-            settings_data["idx_wake_sens"] = call.data["idx_wake_sens"]
+        settings_data = {
+            key: call.data[key] for key in _UPDATE_SETTINGS_KEYS if key in call.data
+        }
 
         if not settings_data:
-            add_log("No settings parameters provided", "warning")
+            runtime_data.logger.warning("No settings parameters provided")
             return
 
-        success = await api_client.update_settings(settings_data)
+        success = await runtime_data.api_client.update_settings(settings_data)
         if success:
-            settings_str = ", ".join([f"{k}: {v}" for k, v in settings_data.items()])
-            add_log(f"Device settings updated: {settings_str}")
+            settings_str = ", ".join(f"{k}: {v}" for k, v in settings_data.items())
+            runtime_data.logger.info("Device settings updated: %s", settings_str)
         else:
-            add_log("Settings update failed", "error")
+            runtime_data.logger.error("Settings update failed")
 
-    async def handle_refresh_device_info(call: ServiceCall) -> None:
+    async def refresh_device_info(self, runtime_data: RuntimeData, call: ServiceCall) -> None:
         """Handle refresh device info service."""
-        device_info = await api_client.get_device_info()
+        device_info = await runtime_data.api_client.get_device_info()
         if device_info:
             runtime_data.device_info = device_info
-            add_log("Device info refreshed")
+            runtime_data.logger.info("Device info refreshed")
         else:
-            add_log("Failed to refresh device info", "error")
+            runtime_data.logger.error("Failed to refresh device info")
 
-    async def handle_sync_photos(call: ServiceCall) -> None:
+    async def sync_photos(self, runtime_data: RuntimeData, call: ServiceCall) -> None:
         """Handle sync photos from media source service."""
         media_source_id = call.data.get("media_source_id")
         target_gallery = call.data.get("target_gallery", "default")
@@ -187,12 +270,12 @@ async def _register_services(hass: HomeAssistant, entry: EinkCanvasConfigEntry)
         overwrite_existing = call.data.get("overwrite_existing", False)
 
         if not media_source_id:
-            add_log("No media source ID provided for photo sync", "error")
+            runtime_data.logger.error("No media source ID provided for photo sync")
             return
 
-        add_log(f"Starting photo sync from {media_source_id} to gallery {target_gallery}")
+        runtime_data.logger.info("Starting photo sync from %s to gallery %s", media_source_id, target_gallery)
         
-        result = await api_client.sync_photos_from_media_source(
+        result = await runtime_data.api_client.sync_photos_from_media_source(
             media_source_id=media_source_id,
             target_gallery=target_gallery,
             max_photos=max_photos,
@@ -200,113 +283,137 @@ async def _register_services(hass: HomeAssistant, entry: EinkCanvasConfigEntry)
         )
 
         if result["success"]:
-            add_log(f"Photo sync completed successfully - Synced: {result['synced_count']}, "
-                   f"Skipped: {result['skipped_count']}, Failed: {result['failed_count']}")
+            runtime_data.logger.info(
+                "Photo sync completed successfully - Synced: %d, Skipped: %d, Failed: %d",
+                result["synced_count"], result["skipped_count"], result["failed_count"]
+            )
         else:
-            add_log(f"Photo sync failed - Errors: {len(result['errors'])}, "
-                   f"Synced: {result['synced_count']}, Failed: {result['failed_count']}", "error")
+            runtime_data.logger.error(
+                "Photo sync failed - Errors: %d, Synced: %d, Failed: %d",
+                result["error_count"], result["synced_count"], result["failed_count"]
+            )
             
             # Log individual errors
-            for error in result["errors"][:5]:  # Limit to first 5 errors
-                add_log(f"Sync error: {error}", "error")
+            for error in result["errors"]:
+                runtime_data.logger.error("Sync error: %s", error)
 
-    async def handle_push_random_item(call: ServiceCall) -> None:
+    async def push_random_item(self, call: ServiceCall) -> None:
         """Handle push random item from media source service."""
         media_source_id = call.data.get("media_source_id")
-        entity_id = call.data.get("entity_id")  # Optional specific media player
+        entity_ids = call.data.get(ATTR_ENTITY_ID)  # Optional specific media players
+        entries = self._target_entries(call)
+
+        if not entries:
+            _LOGGER.error("No loaded BLOOMIN8 E-Ink Canvas device matches %s", entity_ids)
+            return
+
+        def log(level: int, message: str, *args: Any) -> None:
+            """Log to every targeted device."""
+            for entry in entries:
+                entry.runtime_data.logger.log(level, message, *args)
 
         if not media_source_id:
-            add_log("No media source ID provided for push random item", "error")
+            log(logging.ERROR, "No media source ID provided for push random item")
             return
 
-        add_log(f"Getting random photo from {media_source_id}")
+        log(logging.INFO, "Getting random photo from %s", media_source_id)
         
         try:
-            # Browse the media source to get photos (limit to 100 for random selection)
-            photos = await api_client._browse_media_source_photos(media_source_id, 100)
-            
-            if not photos:
-                add_log("No photos found in media source", "error")
+            # Pick a random photo from the media source
+            api_client = entries[0].runtime_data.api_client
+            random_photo = await api_client._pick_random_media_source_photo(media_source_id)
+
+            if not random_photo:
+                log(logging.ERROR, "No photos found in media source")
                 return
             
-            # Pick a random photo
-            random_photo = random.choice(photos)
-            add_log(f"Selected random photo: {random_photo.get('name', 'Unknown')}")
+            log(logging.INFO, "Selected random photo: %s", random_photo.get('name', 'Unknown'))
             
             # Get the media_content_id for the selected photo
             media_content_id = random_photo.get('url')
             if not media_content_id:
-                add_log("Selected photo has no url", "error")
+                log(logging.ERROR, "Selected photo has no url")
                 return
             
             # Find target media players
-            from homeassistant.components.media_player import DOMAIN as MEDIA_DOMAIN
-            
-            if entity_id:
-                # Use the specified media player
-                target_entities = [entity_id]
+            if entity_ids:
+                # Use the specified media players
+                target_entities = entity_ids
             else:
-                # Find all e-ink canvas media players
+                # Use the media players registered by the targeted devices
                 target_entities = [
-                    state.entity_id for state in hass.states.async_all()
-                    if (state.entity_id.startswith(MEDIA_DOMAIN + ".") and
-                        state.attributes.get("manufacturer") == "BLOOMIN8")
+                    media_player_entity_id
+                    for entry in entries
+                    for media_player_entity_id in entry.runtime_data.media_player_entity_ids
                 ]
             
             if not target_entities:
-                add_log("No BLOOMIN8 E-Ink Canvas media players found", "error")
+                log(logging.ERROR, "No BLOOMIN8 E-Ink Canvas media players found")
                 return
             
             # Get the media player entities to call their async_play_media method directly
-            for media_player_entity_id in target_entities:
-                # Get the media player component and entity
-                component = hass.data.get(MEDIA_DOMAIN)
-                if component and hasattr(component, 'get_entity'):
+            component = self.hass.data.get(MEDIA_DOMAIN)
+            media_players = []
+            if component and hasattr(component, 'get_entity'):
+                for media_player_entity_id in target_entities:
                     entity = component.get_entity(media_player_entity_id)
                     if entity and hasattr(entity, 'async_play_media'):
-                        await entity.async_play_media(
-                            'image/jpeg',  # Default to image/jpeg since we know these are photos
-                            media_content_id
-                        )
-                        add_log(f"Successfully pushed random photo to {media_player_entity_id}")
-            
-            add_log(f"Successfully pushed random photo to {len(target_entities)} media player(s)")
+                        media_players.append(entity)
+
+            # Push to all media players concurrently
+            results = await asyncio.gather(
+                *(
+                    entity.async_play_media(
+                        'image/jpeg',  # Default to image/jpeg since we know these are photos
+                        media_content_id
+                    )
+                    for entity in media_players
+                ),
+                return_exceptions=True,
+            )
+            pushed = 0
+            for entity, result in zip(media_players, results):
+                if isinstance(result, Exception):
+                    log(logging.ERROR, "Failed to push random photo to %s: %s", entity.entity_id, result)
+                else:
+                    pushed += 1
+                    log(logging.INFO, "Successfully pushed random photo to %s", entity.entity_id)
+
+            if pushed:
+                log(logging.INFO, "Successfully pushed random photo to %d media player(s)", pushed)
+            else:
+                log(logging.ERROR, "Failed to push random photo to any media player")
             
         except Exception as err:
-            add_log(f"Error pushing random item: {err}", "error")
+            log(logging.ERROR, "Error pushing random item: %s", err)
+
+
+async def _register_services(hass: HomeAssistant) -> None:
+    """Register device control services."""
+    svc = _EinkServices(hass)
 
     # Register all services
-    services = [
-        ("show_next", handle_show_next, {}),
-        ("sleep", handle_sleep, {}),
-        ("reboot", handle_reboot, {}),
-        ("clear_screen", handle_clear_screen, {}),
-        ("whistle", handle_whistle, {}),
-        ("refresh_device_info", handle_refresh_device_info, {}),
-        ("update_settings", handle_update_settings, {
-            vol.Optional("name"): str,
-            vol.Optional("sleep_duration"): int,
-            vol.Optional("max_idle"): int,
-            vol.Optional("idx_wake_sens"): int,
-        }),
-        ("sync_photos", handle_sync_photos, {
-            vol.Required("media_source_id"): str,
-            vol.Optional("target_gallery", default="default"): str,
-            vol.Optional("max_photos", default=50): int,
-            vol.Optional("overwrite_existing", default=False): bool,
-        }),
-        ("push_random_item", handle_push_random_item, {
-            vol.Required("media_source_id"): str,
-            vol.Optional("entity_id"): str,
-        }),
-    ]
-
-    for service_name, handler, schema in services:
+    services = {
+        service_name: (
+            partial(svc.for_each_device, partial(svc.simple_command, service_name, success_msg, failure_msg)),
+            _TARGET_SCHEMA,
+        )
+        for service_name, success_msg, failure_msg in _SIMPLE_SERVICES
+    }
+    services |= {
+        "refresh_device_info": (partial(svc.for_each_device, svc.refresh_device_info), _TARGET_SCHEMA),
+        "update_settings": (partial(svc.for_each_device, svc.update_settings), _UPDATE_SETTINGS_SCHEMA),
+        "sync_photos": (partial(svc.for_each_device, svc.sync_photos), _SYNC_PHOTOS_SCHEMA),
+        "push_random_item": (svc.push_random_item, _PUSH_RANDOM_ITEM_SCHEMA),
+    }
+
+    for service_name in _SERVICE_NAMES:
+        handler, schema = services[service_name]
         hass.services.async_register(
             DOMAIN,
             service_name,
             handler,
-            schema=vol.Schema(schema)
+            schema=schema
         )
 
 
@@ -314,13 +421,16 @@ async def async_unload_entry(hass: HomeAssistant, entry: EinkCanvasConfigEntry)
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
-    if unload_ok:
+    # Services are shared, only remove them when the last device is unloaded
+    last_entry = not any(
+        other.state is ConfigEntryState.LOADED
+        for other in hass.config_entries.async_entries(DOMAIN)
+        if other.entry_id != entry.entry_id
+    )
+
+    if unload_ok and last_entry:
         # Remove services
-        services_to_remove = [
-            "show_next", "sleep", "reboot", "clear_screen",
-            "whistle", "refresh_device_info", "update_settings", "sync_photos", "push_random_item"
-        ]
-        for service in services_to_remove:
+        for service in _SERVICE_NAMES:
             if hass.services.has_service(DOMAIN, service):
                 hass.services.async_remove(DOMAIN, service)
 
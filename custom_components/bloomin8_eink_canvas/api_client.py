@@ -7,16 +7,20 @@ instead of application/json), so we handle JSON parsing manually where needed.
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from collections.abc import Callable, Coroutine, Iterator
+from itertools import islice
 import json
 import logging
+import random
 import time
 from typing import Any
 
 import aiohttp
-import async_timeout
+from yarl import URL
 
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 from homeassistant.components import media_source
 from homeassistant.components.media_player.browse_media import async_process_play_media_url
 from homeassistant.components.media_player import BrowseMedia, MediaClass
@@ -32,38 +36,184 @@ from .const import (
     ENDPOINT_DEVICE_INFO,
     ENDPOINT_UPLOAD,
     ENDPOINT_STATUS,
+    ENDPOINT_GALLERY_LIST,
+    ENDPOINT_GALLERY,
+    DEFAULT_SYNC_CONCURRENCY,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Errors raised by unreachable or misbehaving devices
+_NET_ERRORS = (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError, OSError)
+
+# Consecutive failed uploads after which uploads are skipped for a while
+_UPLOAD_FAILURE_THRESHOLD = 5
+# Seconds before uploads are attempted again
+_UPLOAD_CIRCUIT_RESET = 30
+
+# Media classes and file extensions treated as photos when browsing media sources
+_IMAGE_CLASSES = frozenset({MediaClass.IMAGE})
+_IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp')
+
+# Start of every JPEG file and the smallest download accepted as a photo
+_JPEG_MAGIC = b"\xff\xd8\xff"
+_MIN_JPEG_SIZE = 512
+
+
+def _extract_balanced_json(data: bytes) -> bytes | None:
+    """Return the first balanced {...} object in a malformed response body.
+
+    Braces inside quoted strings are ignored, so values such as "}" do not
+    end the object early.
+    """
+    start = data.find(b"{")
+    if start < 0:
+        return None
+
+    depth = 0
+    in_str = False
+    escape = False
+    for i in range(start, len(data)):
+        char = data[i]
+        if in_str:
+            if escape:
+                escape = False
+            elif char == 0x5C:  # backslash
+                escape = True
+            elif char == 0x22:  # double quote
+                in_str = False
+        elif char == 0x22:
+            in_str = True
+        elif char == 0x7B:  # {
+            depth += 1
+        elif char == 0x7D:  # }
+            depth -= 1
+            if depth == 0:
+                return data[start:i + 1]
+    return None
+
 
 class EinkCanvasApiClient:
     """API client for BLOOMIN8 E-Ink Canvas device."""
 
+    __slots__ = (
+        "_hass",
+        "_host",
+        "_connector",
+        "_default_timeout",
+        "_upload_timeout",
+        "_session",
+        "_urls",
+        "_gallery_cache",
+        "_consecutive_upload_failures",
+        "_circuit_opened_at",
+        "_inflight",
+    )
+
+    # Endpoint names and paths, joined with the host into self._urls
+    _ENDPOINTS = (
+        ("status", ENDPOINT_STATUS),
+        ("device_info", ENDPOINT_DEVICE_INFO),
+        ("show", ENDPOINT_SHOW),
+        ("show_next", ENDPOINT_SHOW_NEXT),
+        ("sleep", ENDPOINT_SLEEP),
+        ("reboot", ENDPOINT_REBOOT),
+        ("clear_screen", ENDPOINT_CLEAR_SCREEN),
+        ("settings", ENDPOINT_SETTINGS),
+        ("whistle", ENDPOINT_WHISTLE),
+        ("upload", ENDPOINT_UPLOAD),
+        ("gallery_list", ENDPOINT_GALLERY_LIST),
+        ("gallery", ENDPOINT_GALLERY),
+    )
+
     def __init__(self, hass: HomeAssistant, host: str) -> None:
         """Initialize the API client."""
         self._hass = hass
         self._host = host
-        self._session = async_get_clientsession(hass)
+        # The client owns a pooled keep-alive session, close it with async_close().
+        # Keep idle sockets open well past the polling interval so polls reuse them.
+        self._connector = aiohttp.TCPConnector(
+            limit=8,
+            limit_per_host=8,
+            keepalive_timeout=120,
+        )
+        # Requests use the session-wide timeout, transfers of photo data get longer
+        self._default_timeout = aiohttp.ClientTimeout(total=10)
+        self._upload_timeout = aiohttp.ClientTimeout(total=30)
+        self._session = aiohttp.ClientSession(
+            connector=self._connector,
+            timeout=self._default_timeout,
+        )
+        # Endpoint URLs are fixed for the lifetime of the client, build them once
+        self._urls = {
+            name: f"http://{host}{endpoint}" for name, endpoint in self._ENDPOINTS
+        }
+        # Photo names per gallery with the monotonic time they were fetched
+        self._gallery_cache: dict[str, tuple[float, set[str]]] = {}
+        # Upload circuit breaker, see upload_image
+        self._consecutive_upload_failures = 0
+        self._circuit_opened_at = 0.0
+        # Requests currently in flight, shared by concurrent callers
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+
+    async def __aenter__(self) -> EinkCanvasApiClient:
+        """Enter the client context."""
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        """Close the client when leaving its context."""
+        await self.async_close()
+
+    async def async_close(self) -> None:
+        """Close the HTTP session owned by the client."""
+        await self._session.close()
 
     @property
     def host(self) -> str:
         """Return the device host."""
         return self._host
 
+    async def _coalesce(
+        self,
+        key: str,
+        request: Callable[[], Coroutine[Any, Any, Any]]
+    ) -> Any:
+        """Share one in-flight request between concurrent callers.
+
+        Args:
+            key: Name identifying the request
+            request: Coroutine function performing the request
+
+        Returns:
+            The result of the shared request
+        """
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(request())
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        # A cancelled caller must not cancel the request for the others
+        return await asyncio.shield(task)
+
     async def get_status(self) -> dict[str, Any] | None:
         """Get device status."""
+        return await self._coalesce("status", self._fetch_status)
+
+    async def _fetch_status(self) -> dict[str, Any] | None:
+        """Request the device status, see get_status."""
         try:
-            async with async_timeout.timeout(10):
-                async with self._session.get(
-                    f"http://{self._host}{ENDPOINT_STATUS}"
-                ) as response:
-                    if response.status == 200:
-                        return await response.json()
-                    return None
-        except Exception as err:
+            async with self._session.get(
+                self._urls["status"]
+            ) as response:
+                if response.status == 200:
+                    return await response.json()
+                return None
+        except _NET_ERRORS as err:
             _LOGGER.debug("Error getting status: %s", err)
             return None
+        except ValueError as err:
+            _LOGGER.debug("Invalid JSON in status response: %s", err)
+            return None
 
     async def get_device_info(self) -> dict[str, Any] | None:
         """Get device information from /deviceInfo endpoint.
@@ -71,107 +221,71 @@ class EinkCanvasApiClient:
         Returns device status including name, version, battery, screen resolution,
         current image, network info, etc. See openapi.yaml for full response schema.
         """
+        return await self._coalesce("device_info", self._fetch_device_info)
+
+    async def _fetch_device_info(self) -> dict[str, Any] | None:
+        """Request the device information, see get_device_info."""
         try:
-            async with async_timeout.timeout(10):
-                async with self._session.get(
-                    f"http://{self._host}{ENDPOINT_DEVICE_INFO}"
-                ) as response:
-                    if response.status == 200:
-                        text_response = await response.text()
-                        # Device may return incorrect content-type, parse JSON manually
-                        try:
-                            return json.loads(text_response)
-                        except json.JSONDecodeError:
-                            # Try to extract JSON from malformed response
-                            start = text_response.find("{")
-                            end = text_response.rfind("}") + 1
-                            if start >= 0 and end > start:
-                                return json.loads(text_response[start:end])
-                            _LOGGER.warning("Invalid JSON in device info response")
-                    return None
-        except Exception as err:
+            async with self._session.get(
+                self._urls["device_info"]
+            ) as response:
+                if response.status == 200:
+                    # Device may return incorrect content-type, parse the raw body
+                    body = await response.read()
+                    try:
+                        return json_loads(body)
+                    except json.JSONDecodeError:
+                        # Try to extract JSON from malformed response
+                        extracted = _extract_balanced_json(body)
+                        if extracted is not None:
+                            return json_loads(extracted)
+                        _LOGGER.warning("Invalid JSON in device info response")
+                return None
+        except _NET_ERRORS as err:
             _LOGGER.debug("Error getting device info: %s", err)
             return None
+        except ValueError as err:
+            _LOGGER.warning("Invalid JSON in device info response: %s", err)
+            return None
 
-    async def show_next(self) -> bool:
-        """Show next image."""
+    async def _simple_request(self, method: str, key: str, log_name: str) -> bool:
+        """Send a request without a body and report whether the device accepted it.
+
+        Args:
+            method: HTTP method ("GET" or "POST")
+            key: Name of the endpoint URL in self._urls
+            log_name: Command name used in log messages
+        """
         try:
-            async with async_timeout.timeout(10):
-                async with self._session.post(
-                    f"http://{self._host}{ENDPOINT_SHOW_NEXT}"
-                ) as response:
-                    if response.status == 200:
-                        _LOGGER.info("Successfully sent showNext command")
-                        return True
-                    _LOGGER.error("ShowNext failed with status %s", response.status)
-                    return False
-        except Exception as err:
-            _LOGGER.error("Error in showNext: %s", err)
+            async with self._session.request(method, self._urls[key]) as response:
+                if response.status == 200:
+                    _LOGGER.info("Successfully sent %s command", log_name)
+                    return True
+                _LOGGER.error("%s failed with status %s", log_name, response.status)
+                return False
+        except _NET_ERRORS as err:
+            _LOGGER.error("Error in %s: %s", log_name, err)
             return False
 
+    async def show_next(self) -> bool:
+        """Show next image."""
+        return await self._simple_request("POST", "show_next", "showNext")
+
     async def sleep(self) -> bool:
         """Put device to sleep."""
-        try:
-            async with async_timeout.timeout(10):
-                async with self._session.post(
-                    f"http://{self._host}{ENDPOINT_SLEEP}"
-                ) as response:
-                    if response.status == 200:
-                        _LOGGER.info("Device sleep command sent successfully")
-                        return True
-                    _LOGGER.error("Sleep failed with status %s", response.status)
-                    return False
-        except Exception as err:
-            _LOGGER.error("Error in sleep: %s", err)
-            return False
+        return await self._simple_request("POST", "sleep", "sleep")
 
     async def reboot(self) -> bool:
         """Reboot device."""
-        try:
-            async with async_timeout.timeout(10):
-                async with self._session.post(
-                    f"http://{self._host}{ENDPOINT_REBOOT}"
-                ) as response:
-                    if response.status == 200:
-                        _LOGGER.info("Device reboot command sent successfully")
-                        return True
-                    _LOGGER.error("Reboot failed with status %s", response.status)
-                    return False
-        except Exception as err:
-            _LOGGER.error("Error in reboot: %s", err)
-            return False
+        return await self._simple_request("POST", "reboot", "reboot")
 
     async def clear_screen(self) -> bool:
         """Clear the screen."""
-        try:
-            async with async_timeout.timeout(10):
-                async with self._session.post(
-                    f"http://{self._host}{ENDPOINT_CLEAR_SCREEN}"
-                ) as response:
-                    if response.status == 200:
-                        _LOGGER.info("Screen cleared successfully")
-                        return True
-                    _LOGGER.error("Clear screen failed with status %s", response.status)
-                    return False
-        except Exception as err:
-            _LOGGER.error("Error in clear screen: %s", err)
-            return False
+        return await self._simple_request("POST", "clear_screen", "clearScreen")
 
     async def whistle(self) -> bool:
         """Send keep-alive signal."""
-        try:
-            async with async_timeout.timeout(10):
-                async with self._session.get(
-                    f"http://{self._host}{ENDPOINT_WHISTLE}"
-                ) as response:
-                    if response.status == 200:
-                        _LOGGER.info("Whistle command sent successfully")
-                        return True
-                    _LOGGER.error("Whistle failed with status %s", response.status)
-                    return False
-        except Exception as err:
-            _LOGGER.error("Error in whistle: %s", err)
-            return False
+        return await self._simple_request("GET", "whistle", "whistle")
 
     async def update_settings(self, settings: dict[str, Any]) -> bool:
         """Update device settings."""
@@ -180,18 +294,16 @@ class EinkCanvasApiClient:
             return False
 
         try:
-            async with async_timeout.timeout(10):
-                async with self._session.post(
-                    f"http://{self._host}{ENDPOINT_SETTINGS}",
-                    json=settings,
-                    headers={"Content-Type": "application/json"}
-                ) as response:
-                    if response.status == 200:
-                        _LOGGER.info("Settings updated successfully: %s", settings)
-                        return True
-                    _LOGGER.error("Settings update failed with status %s", response.status)
-                    return False
-        except Exception as err:
+            async with self._session.post(
+                self._urls["settings"],
+                json=settings
+            ) as response:
+                if response.status == 200:
+                    _LOGGER.info("Settings updated successfully: %s", settings)
+                    return True
+                _LOGGER.error("Settings update failed with status %s", response.status)
+                return False
+        except _NET_ERRORS as err:
             _LOGGER.error("Error in update settings: %s", err)
             return False
 
@@ -210,22 +322,25 @@ class EinkCanvasApiClient:
             dither: Optional dithering algorithm (0=Floyd-Steinberg, 1=JJN)
             duration: Display duration in seconds (default: 99999)
         """
-        try:
-            # Parse image_path to extract gallery and filename
-            # Format: "/gallerys/{gallery}/{filename}"
-            parts = image_path.strip("/").split("/")
-            if len(parts) >= 3 and parts[0] == "gallerys":
-                gallery = parts[1]
-                filename = parts[2]
-            else:
-                # Fallback for unexpected format
-                gallery = "default"
-                filename = image_path.split("/")[-1]
+        if play_type == 0 and image_path.startswith("/gallerys/"):
+            # Single image mode takes the full path as is, no need to split it
+            show_data: dict[str, Any] = {"play_type": 0, "image": image_path}
+            if dither is not None:
+                show_data["dither"] = dither
+            return await self._post_show(show_data)
 
-            return await self.show_image_by_name(filename, gallery, play_type, dither, duration)
-        except Exception as err:
-            _LOGGER.error("Error showing image: %s", err)
-            return False
+        # Parse image_path to extract gallery and filename
+        # Format: "/gallerys/{gallery}/{filename}"
+        parts = image_path.strip("/").split("/")
+        if len(parts) >= 3 and parts[0] == "gallerys":
+            gallery = parts[1]
+            filename = parts[2]
+        else:
+            # Fallback for unexpected format
+            gallery = "default"
+            filename = image_path.split("/")[-1]
+
+        return await self.show_image_by_name(filename, gallery, play_type, dither, duration)
 
     async def show_image_by_name(
         self,
@@ -244,34 +359,38 @@ class EinkCanvasApiClient:
             dither: Optional dithering algorithm (0=Floyd-Steinberg, 1=JJN)
             duration: Display duration in seconds (default: 99999)
         """
-        try:
-            show_data = {
-                "play_type": play_type
-            }
+        show_data: dict[str, Any] = {
+            "play_type": play_type
+        }
 
-            if play_type == 0:
-                # Single image mode: requires full path
-                show_data["image"] = f"/gallerys/{gallery}/{filename}"
-            elif play_type == 1:
-                # Gallery slideshow mode: requires gallery, duration, and filename only
-                show_data["image"] = filename
-                show_data["gallery"] = gallery
-                show_data["duration"] = duration
-            elif play_type == 2:
-                # Playlist mode: would need playlist parameter
-                show_data["image"] = f"/gallerys/{gallery}/{filename}"
+        if play_type == 0:
+            # Single image mode: requires full path
+            show_data["image"] = f"/gallerys/{gallery}/{filename}"
+        elif play_type == 1:
+            # Gallery slideshow mode: requires gallery, duration, and filename only
+            show_data["image"] = filename
+            show_data["gallery"] = gallery
+            show_data["duration"] = duration
+        elif play_type == 2:
+            # Playlist mode: would need playlist parameter
+            show_data["image"] = f"/gallerys/{gallery}/{filename}"
 
-            if dither is not None:
-                show_data["dither"] = dither
+        if dither is not None:
+            show_data["dither"] = dither
+
+        _LOGGER.info("Showing image - gallery: %s, filename: %s, data: %s", gallery, filename, show_data)
 
-            _LOGGER.info("Showing image - gallery: %s, filename: %s, data: %s", gallery, filename, show_data)
+        return await self._post_show(show_data)
 
+    async def _post_show(self, show_data: dict[str, Any]) -> bool:
+        """Send a prepared request body to the /show endpoint."""
+        try:
             async with self._session.post(
-                f"http://{self._host}{ENDPOINT_SHOW}",
+                self._urls["show"],
                 json=show_data
             ) as response:
                 if response.status == 200:
-                    _LOGGER.info("Successfully displayed image: %s/%s", gallery, filename)
+                    _LOGGER.info("Successfully displayed image: %s", show_data.get("image"))
                     return True
                 response_text = await response.text()
                 _LOGGER.error(
@@ -280,7 +399,7 @@ class EinkCanvasApiClient:
                     response_text
                 )
                 return False
-        except Exception as err:
+        except _NET_ERRORS as err:
             _LOGGER.error("Error showing image: %s", err)
             return False
 
@@ -308,59 +427,74 @@ class EinkCanvasApiClient:
             The device returns {"status":100, "path":"/gallerys/default/"} with
             content-type text/javascript. We must append the filename to get the full path.
         """
+        # Fail fast while the device keeps failing uploads instead of waiting
+        # out the retries and timeouts for every photo
+        if (
+            self._consecutive_upload_failures >= _UPLOAD_FAILURE_THRESHOLD
+            and time.monotonic() - self._circuit_opened_at < _UPLOAD_CIRCUIT_RESET
+        ):
+            _LOGGER.warning("Skipping upload of %s, device failed %d uploads in a row",
+                            filename, self._consecutive_upload_failures)
+            return None
+
+        # Build URL with quoted query parameters, the device treats a missing
+        # show_now as 0
+        query = {"filename": filename, "gallery": gallery}
+        if show_now:
+            query["show_now"] = "1"
+        upload_url = URL(self._urls["upload"]).with_query(query)
+
+        # Unlike FormData, a MultipartWriter can be sent again on retry and
+        # wraps the image bytes without copying them
+        form = aiohttp.MultipartWriter("form-data")
+        part = form.append(image_data, {"Content-Type": "image/jpeg"})
+        part.set_content_disposition("form-data", name="image", filename=filename)
+
         for attempt in range(max_retries):
             try:
-                form = aiohttp.FormData()
-                form.add_field(
-                    "image",
-                    image_data,
-                    filename=filename,
-                    content_type="image/jpeg"
-                )
+                async with self._session.post(
+                    upload_url,
+                    data=form,
+                    timeout=self._upload_timeout
+                ) as response:
+                    if response.status == 200:
+                        try:
+                            result = json_loads(await response.read())
+                            _LOGGER.info("Upload response: %s", result)
+                            # Response contains directory path only, append filename
+                            base_path = result.get("path", f"/gallerys/{gallery}/")
+                            if not base_path.endswith("/"):
+                                base_path += "/"
+                            image_path = f"{base_path}{filename}"
+                            self._record_upload(gallery, filename)
+                            _LOGGER.info("Constructed path: %s (base: %s, filename: %s)",
+                                       image_path, base_path, filename)
+                            return image_path
+                        except json.JSONDecodeError as e:
+                            # Fallback to default path construction
+                            _LOGGER.warning("Failed to parse upload response: %s", e)
+                            image_path = f"/gallerys/{gallery}/{filename}"
+                            self._record_upload(gallery, filename)
+                            _LOGGER.info("Using default path: %s", image_path)
+                            return image_path
+
+                    response_text = await response.text()
+                    _LOGGER.error("Upload failed: %s - %s", response.status, response_text)
+                    return None
 
-                # Build URL with query parameters as per original working code
-                upload_url = f"http://{self._host}{ENDPOINT_UPLOAD}?filename={filename}&gallery={gallery}&show_now={'1' if show_now else '0'}"
-
-                async with async_timeout.timeout(30):
-                    async with self._session.post(
-                        upload_url,
-                        data=form
-                    ) as response:
-                        if response.status == 200:
-                            response_text = await response.text()
-
-                            try:
-                                result = json.loads(response_text)
-                                _LOGGER.info("Upload response: %s", result)
-                                # Response contains directory path only, append filename
-                                base_path = result.get("path", f"/gallerys/{gallery}/")
-                                if not base_path.endswith("/"):
-                                    base_path += "/"
-                                image_path = f"{base_path}{filename}"
-                                _LOGGER.info("Constructed path: %s (base: %s, filename: %s)",
-                                           image_path, base_path, filename)
-                                return image_path
-                            except json.JSONDecodeError as e:
-                                # Fallback to default path construction
-                                _LOGGER.warning("Failed to parse upload response: %s", e)
-                                image_path = f"/gallerys/{gallery}/{filename}"
-                                _LOGGER.info("Using default path: %s", image_path)
-                                return image_path
-
-                        response_text = await response.text()
-                        _LOGGER.error("Upload failed: %s - %s", response.status, response_text)
-                        return None
-
-            except (aiohttp.ClientError, asyncio.TimeoutError, ConnectionError) as err:
+            except _NET_ERRORS as err:
                 if attempt < max_retries - 1:
-                    wait_time = 2 ** attempt
+                    # Jitter keeps concurrent uploads from retrying in lockstep
+                    wait_time = (2 ** attempt) * (0.5 + random.random())
                     _LOGGER.warning(
-                        "Upload attempt %d/%d failed: %s. Retrying in %ds...",
+                        "Upload attempt %d/%d failed: %s. Retrying in %.1fs...",
                         attempt + 1, max_retries, err, wait_time
                     )
                     await asyncio.sleep(wait_time)
                 else:
                     _LOGGER.error("Upload failed after %d attempts: %s", max_retries, err)
+                    self._consecutive_upload_failures += 1
+                    self._circuit_opened_at = time.monotonic()
                     return None
             except Exception as err:
                 _LOGGER.error("Unexpected upload error: %s", err)
@@ -368,6 +502,13 @@ class EinkCanvasApiClient:
 
         return None
 
+    def _record_upload(self, gallery: str, filename: str) -> None:
+        """Close the upload circuit and add the photo to the cached gallery names."""
+        self._consecutive_upload_failures = 0
+        cached = self._gallery_cache.get(gallery)
+        if cached is not None:
+            cached[1].add(filename.casefold())
+
     async def get_galleries(self) -> list[dict[str, Any]]:
         """Get list of all galleries via /gallery/list endpoint.
 
@@ -377,18 +518,21 @@ class EinkCanvasApiClient:
         Note:
             Device returns content-type text/json instead of application/json.
         """
+        return await self._coalesce("galleries", self._fetch_galleries)
+
+    async def _fetch_galleries(self) -> list[dict[str, Any]]:
+        """Request the gallery list, see get_galleries."""
         try:
             async with self._session.get(
-                f"http://{self._host}/gallery/list"
+                self._urls["gallery_list"]
             ) as response:
                 if response.status == 200:
-                    text_response = await response.text()
                     try:
-                        return json.loads(text_response)
+                        return json_loads(await response.read())
                     except json.JSONDecodeError as err:
                         _LOGGER.error("Failed to parse galleries response: %s", err)
                 return []
-        except Exception as err:
+        except _NET_ERRORS as err:
             _LOGGER.error("Error getting galleries: %s", err)
             return []
 
@@ -416,20 +560,81 @@ class EinkCanvasApiClient:
                 "limit": limit
             }
             async with self._session.get(
-                f"http://{self._host}/gallery",
+                self._urls["gallery"],
                 params=params
             ) as response:
                 if response.status == 200:
-                    text_response = await response.text()
                     try:
-                        return json.loads(text_response)
+                        return json_loads(await response.read())
                     except json.JSONDecodeError as err:
                         _LOGGER.error("Failed to parse gallery images response: %s", err)
                 return {"data": []}
-        except Exception as err:
+        except _NET_ERRORS as err:
             _LOGGER.error("Error getting gallery images: %s", err)
             return {"data": []}
 
+    async def get_all_gallery_images(
+        self,
+        gallery_name: str,
+        page_size: int = 100
+    ) -> list[dict[str, Any]] | None:
+        """Get every image in a gallery, fetching the remaining pages concurrently.
+
+        Args:
+            gallery_name: Gallery name to query
+            page_size: Number of items requested per page
+
+        Returns:
+            List of image objects with 'name', 'size', 'time' fields,
+            or None if the gallery could not be listed
+        """
+        first = await self.get_gallery_images(gallery_name, 0, page_size)
+        # Failed requests return a bare {"data": []} without a total
+        if "total" not in first:
+            return None
+        images = list(first.get("data", []))
+
+        total = first.get("total", 0)
+        if total > page_size:
+            pages = await asyncio.gather(
+                *(
+                    self.get_gallery_images(gallery_name, offset, page_size)
+                    for offset in range(page_size, total, page_size)
+                )
+            )
+            for page in pages:
+                # A missing page would leave the listing incomplete
+                if "total" not in page:
+                    return None
+                images.extend(page.get("data", []))
+
+        return images
+
+    async def _existing_names(self, gallery: str, ttl: float = 30.0) -> set[str]:
+        """Return the photo names in a gallery, cached for a short time.
+
+        Args:
+            gallery: Gallery name to query
+            ttl: Seconds a fetched name set stays valid
+
+        Returns:
+            Set of casefolded photo names, kept up to date by upload_image.
+            Empty and not cached if the gallery could not be listed.
+        """
+        cached = self._gallery_cache.get(gallery)
+        if cached is not None and time.monotonic() - cached[0] < ttl:
+            return cached[1]
+
+        images = await self.get_all_gallery_images(gallery)
+        if images is None:
+            # Don't let a failed listing stand in for an empty gallery
+            _LOGGER.warning("Could not list photos in gallery %s", gallery)
+            return set()
+
+        names = {photo["name"].casefold() for photo in images}
+        self._gallery_cache[gallery] = (time.monotonic(), names)
+        return names
+
     async def sync_photos_from_media_source(
         self,
         media_source_id: str,
@@ -451,7 +656,8 @@ class EinkCanvasApiClient:
             - synced_count: int - Number of photos successfully synced
             - skipped_count: int - Number of photos skipped
             - failed_count: int - Number of photos that failed to sync
-            - errors: list[str] - List of error messages
+            - errors: deque[str] - The 5 most recent error messages
+            - error_count: int - Total number of errors
             - synced_photos: list[str] - List of synced photo paths
 
         Raises:
@@ -463,7 +669,8 @@ class EinkCanvasApiClient:
             "synced_count": 0,
             "skipped_count": 0,
             "failed_count": 0,
-            "errors": [],
+            "errors": deque(maxlen=5),
+            "error_count": 0,
             "synced_photos": []
         }
 
@@ -484,51 +691,35 @@ class EinkCanvasApiClient:
             _LOGGER.info("Found %d photos to sync", len(photos))
 
             # Get existing photos in target gallery if overwrite_existing is False
-            existing_photos = set()
+            existing_photos: set[str] | frozenset[str] = frozenset()
             if not overwrite_existing:
-                gallery_info = await self.get_gallery_images(target_gallery, offset=0, limit=1000)
-                existing_photos = {photo["name"] for photo in gallery_info.get("data", [])}
+                existing_photos = await self._existing_names(target_gallery)
                 _LOGGER.info("Found %d existing photos in gallery %s", len(existing_photos), target_gallery)
 
-            # Sync each photo
-            for photo_info in photos:
-                try:
-                    photo_name = photo_info["name"]
-                    photo_url = photo_info["url"]
-
-                    # Check if photo already exists
-                    if not overwrite_existing and photo_name in existing_photos:
-                        _LOGGER.debug("Skipping existing photo: %s", photo_name)
-                        result["skipped_count"] += 1
-                        continue
-
-                    # Download photo data
-                    photo_data = await self._download_photo_data(photo_url)
-                    if not photo_data:
-                        result["errors"].append(f"Failed to download photo: {photo_name}")
-                        result["failed_count"] += 1
-                        continue
-
-                    # Upload to device
-                    uploaded_path = await self.upload_image(
-                        photo_data,
-                        photo_name,
-                        gallery=target_gallery,
-                        show_now=False
-                    )
-
-                    if uploaded_path:
-                        result["synced_photos"].append(uploaded_path)
-                        result["synced_count"] += 1
-                        _LOGGER.info("Successfully synced photo: %s -> %s", photo_name, uploaded_path)
-                    else:
-                        result["errors"].append(f"Failed to upload photo: {photo_name}")
-                        result["failed_count"] += 1
-
-                except Exception as err:
-                    error_msg = f"Error syncing photo {photo_info.get('name', 'unknown')}: {str(err)}"
+            # Sync photos concurrently, bounded by the semaphore
+            sem = asyncio.Semaphore(DEFAULT_SYNC_CONCURRENCY)
+            tasks = [
+                asyncio.create_task(self._sync_one(photo_info, sem, existing_photos, target_gallery))
+                for photo_info in photos
+            ]
+            # Cancelling the sync makes gather cancel every in-flight photo task
+            outcomes = await asyncio.gather(*tasks, return_exceptions=True)
+
+            for photo_info, outcome in zip(photos, outcomes):
+                if isinstance(outcome, BaseException):
+                    error_msg = f"Error syncing photo {photo_info.get('name', 'unknown')}: {str(outcome)}"
                     _LOGGER.error(error_msg)
-                    result["errors"].append(error_msg)
+                    outcome = ("failed", error_msg)
+
+                status, detail = outcome
+                if status == "synced":
+                    result["synced_photos"].append(detail)
+                    result["synced_count"] += 1
+                elif status == "skipped":
+                    result["skipped_count"] += 1
+                else:
+                    result["errors"].append(detail)
+                    result["error_count"] += 1
                     result["failed_count"] += 1
 
             # Determine overall success
@@ -545,8 +736,60 @@ class EinkCanvasApiClient:
             error_msg = f"Photo sync failed: {str(err)}"
             _LOGGER.error(error_msg)
             result["errors"].append(error_msg)
+            result["error_count"] += 1
             return result
 
+    async def _sync_one(
+        self,
+        photo_info: dict[str, str],
+        sem: asyncio.Semaphore,
+        existing_photos: set[str] | frozenset[str],
+        target_gallery: str
+    ) -> tuple[str, str]:
+        """Sync a single photo to a device gallery.
+
+        Args:
+            photo_info: Photo info dict with 'name' and 'url' keys
+            sem: Semaphore bounding concurrent downloads and uploads
+            existing_photos: Casefolded names already in the gallery, skipped when present
+            target_gallery: Target gallery name on device
+
+        Returns:
+            Tuple of status ("synced", "skipped" or "failed") and the uploaded
+            path, photo name or error message respectively
+        """
+        photo_name = photo_info["name"]
+
+        # Check if photo already exists
+        if photo_name.casefold() in existing_photos:
+            _LOGGER.debug("Skipping existing photo: %s", photo_name)
+            return "skipped", photo_name
+
+        async with sem:
+            # Download photo data
+            photo_data = await self._download_photo_data(photo_info["url"])
+            if not photo_data:
+                return "failed", f"Failed to download photo: {photo_name}"
+
+            # Don't spend an upload on error pages or truncated files
+            if len(photo_data) < _MIN_JPEG_SIZE or not photo_data.startswith(_JPEG_MAGIC):
+                _LOGGER.warning("Downloaded data for %s is not a JPEG image", photo_name)
+                return "failed", f"Invalid JPEG: {photo_name}"
+
+            # Upload to device
+            uploaded_path = await self.upload_image(
+                photo_data,
+                photo_name,
+                gallery=target_gallery,
+                show_now=False
+            )
+
+        if not uploaded_path:
+            return "failed", f"Failed to upload photo: {photo_name}"
+
+        _LOGGER.info("Successfully synced photo: %s -> %s", photo_name, uploaded_path)
+        return "synced", uploaded_path
+
     async def _browse_media_source_photos(self, media_source_id: str, max_photos: int) -> list[dict[str, str]]:
         """Browse media source and return list of photos.
 
@@ -575,7 +818,7 @@ class EinkCanvasApiClient:
                 _LOGGER.debug("No children found in media source")
 
             # Extract photos from media item (recursive)
-            photos = await self._extract_photos_from_media_item(media_item, max_photos)
+            photos = self._extract_photos_from_media_item(media_item, max_photos)
 
             # Limit results
             if len(photos) > max_photos:
@@ -587,70 +830,95 @@ class EinkCanvasApiClient:
 
         return photos
 
-    async def _extract_photos_from_media_item(
+    async def _pick_random_media_source_photo(self, media_source_id: str) -> dict[str, str] | None:
+        """Pick one photo uniformly at random from a media source.
+
+        Uses reservoir sampling over the browse result, so only the current
+        pick is kept instead of a list of every photo.
+
+        Args:
+            media_source_id: Media source identifier
+
+        Returns:
+            Photo info dict with 'name' and 'url' keys, or None if no photo was found
+        """
+        try:
+            media_item = await media_source.async_browse_media(
+                self._hass,
+                media_source_id
+            )
+        except Exception as err:
+            _LOGGER.error("Error browsing media source %s: %s", media_source_id, err)
+            return None
+
+        picked = None
+        for seen, photo_info in enumerate(self._iter_photos(media_item), 1):
+            # Replace the pick with probability 1/seen
+            if random.randrange(seen) == 0:
+                picked = photo_info
+
+        return picked
+
+    def _extract_photos_from_media_item(
         self,
         media_item,
-        max_photos: int,
-        photos: list | None = None
+        max_photos: int
     ) -> list[dict[str, str]]:
-        """Recursively extract photos from media item.
+        """Extract photos from media item and its children.
 
         Args:
             media_item: BrowseMedia item
             max_photos: Maximum photos to collect
-            photos: Existing photos list (for recursion)
 
         Returns:
             List of photo info dicts
         """
-        if photos is None:
-            photos = []
-
-        # Stop if we've reached max photos
-        if len(photos) >= max_photos:
-            return photos
-
-        # Check if this is a media item (photo)
-        # For Immich: images have media_class=image but can_play=false
-        # For other sources: images might have can_play=true
-        is_photo = (
-            (hasattr(media_item, 'media_class') and 
-             media_item.media_class == MediaClass.IMAGE) or
-            (hasattr(media_item, 'media_content_type') and
-             media_item.media_content_type and
-             media_item.media_content_type.startswith("image/")) or
-            (hasattr(media_item, 'title') and 
-             any(media_item.title.lower().endswith(ext) for ext in ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.webp']))
-        )
+        return list(islice(self._iter_photos(media_item), max_photos))
 
-        # Ensure it's not a directory/container and has a media_content_id
-        is_not_directory = (
-            hasattr(media_item, 'children_media_class') and
-            media_item.children_media_class is None
-        ) or (
-            hasattr(media_item, 'can_expand') and
-            not media_item.can_expand
-        )
+    def _iter_photos(self, media_item) -> Iterator[dict[str, str]]:
+        """Yield photos found in a media item and its children, depth first.
 
-        if is_photo and is_not_directory and hasattr(media_item, 'media_content_id'):
-            photo_info = {
-                "name": media_item.title if hasattr(media_item, 'title') else "unknown",
-                "url": media_item.media_content_id
-            }
-            photos.append(photo_info)
-            _LOGGER.debug("Found photo: %s -> %s", photo_info["name"], photo_info["url"])
+        Args:
+            media_item: BrowseMedia item
 
-        # If this has children, recurse
-        if (hasattr(media_item, 'children') and
-            media_item.children and
-            len(photos) < max_photos):
-            
-            for child in media_item.children:
-                photos = await self._extract_photos_from_media_item(child, max_photos, photos)
-                if len(photos) >= max_photos:
-                    break
+        Yields:
+            Photo info dicts with 'name' and 'url' keys
+        """
+        stack = deque([media_item])
+
+        while stack:
+            node = stack.pop()
+            title = getattr(node, 'title', None)
+            content_type = getattr(node, 'media_content_type', None)
+
+            # Check if this is a media item (photo)
+            # For Immich: images have media_class=image but can_play=false
+            # For other sources: images might have can_play=true
+            is_photo = (
+                getattr(node, 'media_class', None) in _IMAGE_CLASSES or
+                (content_type and content_type.startswith("image/")) or
+                (title is not None and title.lower().endswith(_IMAGE_EXTENSIONS))
+            )
 
-        return photos
+            # Ensure it's not a directory/container and has a media_content_id
+            is_not_directory = (
+                getattr(node, 'children_media_class', False) is None or
+                not getattr(node, 'can_expand', True)
+            )
+
+            content_id = getattr(node, 'media_content_id', None)
+            if is_photo and is_not_directory and content_id is not None:
+                photo_info = {
+                    "name": title if title is not None else "unknown",
+                    "url": content_id
+                }
+                _LOGGER.debug("Found photo: %s -> %s", photo_info["name"], photo_info["url"])
+                yield photo_info
+
+            # Visit children next, in their original order
+            children = getattr(node, 'children', None)
+            if children:
+                stack.extend(reversed(children))
 
     async def _download_photo_data(self, photo_url: str) -> bytes | None:
         """Download photo data from URL.
@@ -669,13 +937,12 @@ class EinkCanvasApiClient:
                 )
                 photo_url = async_process_play_media_url(self._hass, play_item.url)
 
-            async with async_timeout.timeout(30):
-                async with self._session.get(photo_url) as response:
-                    if response.status == 200:
-                        return await response.read()
-                    else:
-                        _LOGGER.error("Failed to download photo from %s: status %d", photo_url, response.status)
-                        return None
+            async with self._session.get(photo_url, timeout=self._upload_timeout) as response:
+                if response.status == 200:
+                    return await response.read()
+                else:
+                    _LOGGER.error("Failed to download photo from %s: status %d", photo_url, response.status)
+                    return None
 
         except Exception as err:
             _LOGGER.error("Error downloading photo from %s: %s", photo_url, err)
@@ -5,7 +5,7 @@ import logging
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_NAME, EntityCategory
+from homeassistant.const import ATTR_ENTITY_ID, CONF_HOST, CONF_NAME, EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
@@ -72,7 +72,7 @@ class EinkNextImageButton(EinkBaseButton):
         await self.hass.services.async_call(
             DOMAIN,
             "show_next",
-            {},
+            {ATTR_ENTITY_ID: self.entity_id},
             blocking=True,
         )
 
@@ -94,7 +94,7 @@ class EinkRebootButton(EinkBaseButton):
         await self.hass.services.async_call(
             DOMAIN,
             "reboot",
-            {},
+            {ATTR_ENTITY_ID: self.entity_id},
             blocking=True,
         )
 
@@ -114,7 +114,7 @@ class EinkClearScreenButton(EinkBaseButton):
         await self.hass.services.async_call(
             DOMAIN,
             "clear_screen",
-            {},
+            {ATTR_ENTITY_ID: self.entity_id},
             blocking=True,
         )
 
@@ -134,7 +134,7 @@ class EinkWhistleButton(EinkBaseButton):
         await self.hass.services.async_call(
             DOMAIN,
             "whistle",
-            {},
+            {ATTR_ENTITY_ID: self.entity_id},
             blocking=True,
         )
 
@@ -155,6 +155,6 @@ class EinkRefreshButton(EinkBaseButton):
         await self.hass.services.async_call(
             DOMAIN,
             "refresh_device_info",
-            {},
+            {ATTR_ENTITY_ID: self.entity_id},
             blocking=True,
         )
\ No newline at end of file
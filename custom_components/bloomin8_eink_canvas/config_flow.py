@@ -39,10 +39,9 @@ async def validate_input(hass: HomeAssistant, data: dict) -> dict:
     host = data[CONF_HOST]
     _LOGGER.info("Attempting to connect to device at: %s", host)
 
-    api_client = EinkCanvasApiClient(hass, host)
-
     # Try to get device info to verify connection
-    device_info = await api_client.get_device_info()
+    async with EinkCanvasApiClient(hass, host) as api_client:
+        device_info = await api_client.get_device_info()
     if device_info is None:
         _LOGGER.error("Failed to connect to device at %s - no response from /deviceInfo endpoint", host)
         raise CannotConnect
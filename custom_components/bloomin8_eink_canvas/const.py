@@ -39,6 +39,9 @@ DEFAULT_NAME = "BLOOMIN8 Canvas"  # Default name for the device
 #   28.5" Canvas: 2160x3060
 SUPPORTED_FORMATS = ["JPEG", "JPG", "PNG", "GIF", "BMP", "WEBP"]  # Supported input image formats that will be converted to JPEG
 
+# Photo sync
+DEFAULT_SYNC_CONCURRENCY = 4  # Maximum photos downloaded/uploaded at the same time
+
 # Configuration
 CONF_NAME = "name"
 CONF_ORIENTATION = "orientation"
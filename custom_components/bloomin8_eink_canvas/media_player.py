@@ -4,7 +4,6 @@ from __future__ import annotations
 import logging
 import os
 import time
-from datetime import datetime
 from io import BytesIO
 
 from PIL import Image
@@ -19,7 +18,7 @@ from homeassistant.components.media_player import (
 )
 from homeassistant.components import media_source
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_NAME
+from homeassistant.const import ATTR_ENTITY_ID, CONF_HOST, CONF_NAME
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
@@ -86,6 +85,16 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
         self._screen_width = None
         self._screen_height = None
 
+    async def async_added_to_hass(self) -> None:
+        """Register the entity so services can target it without a state scan."""
+        await super().async_added_to_hass()
+        self._config_entry.runtime_data.media_player_entity_ids.add(self.entity_id)
+
+    async def async_will_remove_from_hass(self) -> None:
+        """Unregister the entity from the runtime data."""
+        await super().async_will_remove_from_hass()
+        self._config_entry.runtime_data.media_player_entity_ids.discard(self.entity_id)
+
     @property
     def device_info(self) -> DeviceInfo:
         """Return device information."""
@@ -159,7 +168,7 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
         await self.hass.services.async_call(
             DOMAIN,
             "whistle",
-            {},
+            {ATTR_ENTITY_ID: self.entity_id},
             blocking=True,
         )
 
@@ -168,7 +177,7 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
         await self.hass.services.async_call(
             DOMAIN,
             "sleep",
-            {},
+            {ATTR_ENTITY_ID: self.entity_id},
             blocking=True,
         )
 
@@ -177,7 +186,7 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
         await self.hass.services.async_call(
             DOMAIN,
             "show_next",
-            {},
+            {ATTR_ENTITY_ID: self.entity_id},
             blocking=True,
         )
 
@@ -189,10 +198,11 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
 
         runtime_data = self._config_entry.runtime_data
         api_client = runtime_data.api_client
+        logger = runtime_data.logger
 
         try:
             # Add log
-            await self._add_log(f"Playing media: {media_id}")
+            logger.info("Playing media: %s", media_id)
 
             # Handle media source resolution first
             if media_source.is_media_source_id(media_id):
@@ -208,29 +218,29 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
                 await self.async_update()
 
             if self._screen_width is None or self._screen_height is None:
-                await self._add_log("Failed to detect screen resolution", "error")
+                logger.error("Failed to detect screen resolution")
                 return
 
             # Guard clause: Handle gallery images directly
             if media_id.startswith("/gallerys/"):
                 success = await api_client.show_image(media_id)
                 if success:
-                    await self._add_log(f"Successfully displayed image via /show API: {media_id}")
+                    logger.info("Successfully displayed image via /show API: %s", media_id)
                 else:
-                    await self._add_log(f"Failed to show image: {media_id}", "error")
+                    logger.error("Failed to show image: %s", media_id)
                 await self.async_update()
                 return
 
             # Handle external images - upload and show
             image_data = await self._load_image_data(media_id)
             if not image_data:
-                await self._add_log(f"Failed to load image: {media_id}", "error")
+                logger.error("Failed to load image: %s", media_id)
                 return
 
             # Process image for e-ink display
             processed_image_data = await self._process_image(image_data)
             if not processed_image_data:
-                await self._add_log("Failed to process image", "error")
+                logger.error("Failed to process image")
                 return
 
             # Generate filename and upload
@@ -238,24 +248,23 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
             gallery = "default"
             uploaded_path = await api_client.upload_image(processed_image_data, filename, gallery=gallery)
             if not uploaded_path:
-                await self._add_log(f"Upload failed: {filename}", "error")
+                logger.error("Upload failed: %s", filename)
                 return
 
-            await self._add_log(f"Successfully uploaded image: {uploaded_path}")
+            logger.info("Successfully uploaded image: %s", uploaded_path)
 
             # Show the uploaded image - use play_type=0 (single image mode)
             success = await api_client.show_image_by_name(filename, gallery, play_type=0)
             if success:
-                await self._add_log(f"Successfully displayed uploaded image: {filename}")
+                logger.info("Successfully displayed uploaded image: %s", filename)
             else:
-                await self._add_log(f"Failed to show uploaded image: {filename}", "error")
+                logger.error("Failed to show uploaded image: %s", filename)
 
             # Refresh device info
             await self.async_update()
 
         except Exception as err:
-            await self._add_log(f"Error playing media: {str(err)}", "error")
-            _LOGGER.error("Error playing media: %s", str(err))
+            logger.error("Error playing media: %s", err)
 
     async def _load_image_data(self, media_id: str) -> bytes | None:
         """Load image data from file or URL."""
@@ -606,13 +615,3 @@ class EinkDisplayMediaPlayer(MediaPlayerEntity):
             children=children,
         )
 
-    async def _add_log(self, message: str, level: str = "info") -> None:
-        """Add log entry."""
-        runtime_data = self._config_entry.runtime_data
-        runtime_data.logs.append({
-            "timestamp": datetime.now(),
-            "level": level,
-            "message": message,
-        })
-        if len(runtime_data.logs) > 50:
-            runtime_data.logs.pop(0)
@@ -5,7 +5,7 @@ import logging
 
 from homeassistant.components.select import SelectEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_NAME, EntityCategory
+from homeassistant.const import ATTR_ENTITY_ID, CONF_HOST, CONF_NAME, EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
@@ -139,6 +139,7 @@ class EinkSleepDurationSelect(EinkBaseSelect):
             DOMAIN,
             "update_settings",
             {
+                ATTR_ENTITY_ID: self.entity_id,
                 "name": device_info.get("name", "E-Ink Canvas"),
                 "sleep_duration": SLEEP_DURATION_OPTIONS[option],
                 "max_idle": device_info.get("max_idle", 300),
@@ -191,6 +192,7 @@ class EinkMaxIdleSelect(EinkBaseSelect):
             DOMAIN,
             "update_settings",
             {
+                ATTR_ENTITY_ID: self.entity_id,
                 "name": device_info.get("name", "E-Ink Canvas"),
                 "sleep_duration": device_info.get("sleep_duration", 86400),
                 "max_idle": MAX_IDLE_OPTIONS[option],
@@ -243,6 +245,7 @@ class EinkWakeSensitivitySelect(EinkBaseSelect):
             DOMAIN,
             "update_settings",
             {
+                ATTR_ENTITY_ID: self.entity_id,
                 "name": device_info.get("name", "E-Ink Canvas"),
                 "sleep_duration": device_info.get("sleep_duration", 86400),
                 "max_idle": device_info.get("max_idle", 300),
@@ -13,6 +13,7 @@ from homeassistant.const import CONF_HOST, CONF_NAME, PERCENTAGE, EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.util import dt as dt_util
 
 from .const import (
     DOMAIN,
@@ -256,19 +257,19 @@ class EinkLogSensor(EinkBaseSensor):
         logs = runtime_data.logs
 
         if logs:
-            latest_log = logs[-1]
-            self._attr_native_value = latest_log["message"]
+            latest_created, latest_level, latest_message = logs[-1]
+            self._attr_native_value = latest_message
 
             # Show recent 10 logs in attributes
-            recent_logs = logs[-10:] if len(logs) > 10 else logs
+            recent_logs = list(logs)[-10:]
             log_history = []
-            for log in recent_logs:
-                timestamp = log["timestamp"].strftime("%H:%M:%S")
-                log_history.append(f"[{timestamp}] {log['level'].upper()}: {log['message']}")
+            for created, level, message in recent_logs:
+                timestamp = dt_util.as_local(dt_util.utc_from_timestamp(created)).strftime("%H:%M:%S")
+                log_history.append(f"[{timestamp}] {level}: {message}")
 
             self._attr_extra_state_attributes = {
-                "latest_level": latest_log["level"],
-                "latest_timestamp": latest_log["timestamp"].isoformat(),
+                "latest_level": latest_level.lower(),
+                "latest_timestamp": dt_util.as_local(dt_util.utc_from_timestamp(latest_created)).isoformat(),
                 "total_logs": len(logs),
                 "recent_logs": log_history,
             }
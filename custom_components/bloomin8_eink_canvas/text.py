@@ -5,7 +5,7 @@ import logging
 
 from homeassistant.components.text import TextEntity, TextMode
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_NAME, EntityCategory
+from homeassistant.const import ATTR_ENTITY_ID, CONF_HOST, CONF_NAME, EntityCategory
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.entity import DeviceInfo
@@ -85,6 +85,7 @@ class EinkDeviceNameText(TextEntity):
             DOMAIN,
             "update_settings",
             {
+                ATTR_ENTITY_ID: self.entity_id,
                 "name": value,
                 "sleep_duration": device_info.get("sleep_duration", 86400),
                 "max_idle": device_info.get("max_idle", 300),